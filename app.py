@@ -1,20 +1,33 @@
-from flask import Flask, render_template, request, redirect, url_for, session, send_file
+from flask import Flask, render_template, request, redirect, url_for, send_file, abort
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, event, case, insert, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import deferred, undefer, load_only, make_transient_to_detached
+from sqlalchemy.dialects.postgresql import JSONB
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import OrderedDict
+from itertools import groupby
 import secrets
+import random
+import threading
+import time
+import orjson
 import os
-import re
+import glob
 from dotenv import load_dotenv
-from generator import QuestionGenerator
+from generator import QuestionGenerator, GenerationError, question_tokens, is_near_duplicate
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from io import BytesIO
+from reportlab.lib.enums import TA_CENTER
+from tempfile import gettempdir, mkstemp
 
 load_dotenv()
 
@@ -33,10 +46,60 @@ if database_url and database_url.startswith('postgres://'):
 
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# One connection per gthread request thread (8) plus the PDF report threads (2);
+# keep pool_size * gunicorn workers under ~80% of Postgres max_connections
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     'pool_pre_ping': True,
     'pool_recycle': 300,
+    'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 5)),
+    'pool_timeout': 5,
+    'json_serializer': lambda obj: orjson.dumps(obj).decode(),
+    'json_deserializer': orjson.loads,
 }
+if database_url and database_url.startswith('postgresql'):
+    # Cap runaway queries, 10 seconds by default (0 disables the limit)
+    statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 10000))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS']['connect_args'] = {
+        'options': f'-c statement_timeout={statement_timeout}'
+    }
+
+# Questions requested per batched generation call; past ~10 answers get
+# slower to decode and one malformed reply loses more questions
+QUESTIONS_PER_BATCH = 10
+
+# Upper bound on concurrent question generation requests per quiz
+MAX_GENERATION_WORKERS = 8
+
+# Quiz radio buttons post "i<index>", so an option whose text is a number
+# posted by an older page is not mistaken for an index
+OPTION_VALUE_PREFIX = 'i'
+
+# Quiz size limits, matching the create-quiz form
+MIN_QUIZ_QUESTIONS = 1
+MAX_QUIZ_QUESTIONS = 20
+# Time budget for generating one quiz, kept under gunicorn's 120s worker
+# timeout so partial results can still be saved for a retry
+GENERATION_DEADLINE_SECONDS = 90
+
+# Rounds of single-question top-ups when generated questions turn out to be duplicates
+MAX_TOPUP_ROUNDS = 2
+
+# Attempts at inserting a quiz with a fresh share_link after a collision
+SHARE_LINK_ATTEMPTS = 3
+
+# Threads building PDF reports, and how long a download waits before showing a progress page
+PDF_REPORT_WORKERS = 2
+PDF_INLINE_WAIT_SECONDS = 5
+
+# Finished PDF reports are written here so every gunicorn worker can serve them
+PDF_REPORT_DIR = os.getenv('PDF_REPORT_DIR', os.path.join(gettempdir(), 'quiz-reports'))
+
+# Attempts shown per page on the quiz report
+REPORT_ATTEMPTS_PER_PAGE = 50
+
+# Rows per results table in the PDF, keeps ReportLab's table layout cost bounded
+PDF_RESULTS_ROWS_PER_TABLE = 25
 
 db = SQLAlchemy(app)
 login_manager = LoginManager()
@@ -44,6 +107,9 @@ login_manager.init_app(app)
 login_manager.login_view = 'login'
 
 # Database Models
+# Stored as JSONB on PostgreSQL, plain JSON elsewhere
+JSONColumn = db.JSON().with_variant(JSONB(), 'postgresql')
+
 class User(UserMixin, db.Model):
     __tablename__ = 'user'
     
@@ -63,8 +129,10 @@ class Quiz(db.Model):
     title = db.Column(db.String(200), nullable=False)
     topic = db.Column(db.String(100), nullable=False)
     difficulty = db.Column(db.String(20), nullable=False)
-    share_link = db.Column(db.String(50), unique=True, nullable=False)
-    questions = db.Column(db.JSON, nullable=False)
+    share_link = db.Column(db.String(50), unique=True, index=True, nullable=False)
+    # Only loaded on access, listings and reports use num_questions instead
+    questions = deferred(db.Column(JSONColumn, nullable=False))
+    num_questions = db.Column(db.Integer, nullable=False, default=0)
     shuffle_options = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     attempts = db.relationship('QuizAttempt', backref='quiz', lazy=True, cascade='all, delete-orphan')
@@ -78,55 +146,308 @@ class QuizAttempt(db.Model):
     student_email = db.Column(db.String(100))
     score = db.Column(db.Integer, nullable=False)
     total_questions = db.Column(db.Integer, nullable=False)
-    answers = db.Column(db.JSON, nullable=False)
+    answers = db.Column(JSONColumn, nullable=False)
     completed_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+# Composite indexes matching the filter + ORDER BY of my_quizzes and the report pages
+db.Index('ix_quiz_user_id_created_at', Quiz.user_id, Quiz.created_at.desc())
+db.Index('ix_quiz_attempt_quiz_id_completed_at', QuizAttempt.quiz_id, QuizAttempt.completed_at.desc())
+
+# Columns kept in user_cache; the password hash is left to load on demand
+USER_CACHE_COLUMNS = ('id', 'username', 'email', 'name', 'created_at')
+
 @login_manager.user_loader
 def load_user(user_id):
-    return db.session.get(User, int(user_id))
+    # Flask-Login already keeps the user for the rest of the request; this
+    # also skips the SELECT on later requests within the cache TTL
+    data = user_cache.get(user_id)
+    if data is None:
+        user = db.session.get(User, int(user_id))
+        if user is not None:
+            user_cache.set(user_id, {column: getattr(user, column) for column in USER_CACHE_COLUMNS})
+        return user
+    
+    user = User(**data)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+# argon2id is cheaper per login than werkzeug's default pbkdf2 at comparable strength
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+# Compared against on failed username lookups to keep login timing uniform
+_DUMMY_PASSWORD_HASH = password_hasher.hash(secrets.token_hex(16))
+
+def verify_password(password_hash, password):
+    """Check a password against an argon2 or legacy werkzeug hash; returns (ok, needs_rehash)"""
+    if not password_hash.startswith('$argon2'):
+        return check_password_hash(password_hash, password), True
+    
+    try:
+        password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False, False
+    return True, password_hasher.check_needs_rehash(password_hash)
+
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """Use WAL journaling so quiz submissions don't block concurrent reads"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
 
 # Initialize database
 with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', _set_sqlite_pragma)
     db.create_all()
 
+# Shared question generator, created on first use so a missing API key
+# doesn't stop the app from starting
+_generator = None
+_generator_lock = threading.Lock()
+
+def get_generator():
+    """Return the shared QuestionGenerator instance"""
+    global _generator
+    if _generator is None:
+        with _generator_lock:
+            if _generator is None:
+                _generator = QuestionGenerator()
+    return _generator
+
+class TTLCache:
+    """Thread-safe in-process LRU cache whose entries expire after a fixed time"""
+    
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+# Logged-in user columns by user id string, saves a SELECT per authenticated request
+user_cache = TTLCache(maxsize=1024, ttl=30)
+
+# Quiz ids by share_link, so quiz lookups go by primary key
+quiz_id_cache = TTLCache(maxsize=4096, ttl=300)
+
+# Rendered take-quiz pages for anonymous visitors, keyed by share_link. The
+# short TTL bounds staleness across gunicorn workers after a quiz is deleted
+quiz_page_cache = TTLCache(maxsize=1024, ttl=60)
+
+# Questions generated before a create-quiz request failed, keyed by
+# (user_id, topic, difficulty, shuffle_options) so a retry only fills the gap
+pending_questions_cache = TTLCache(maxsize=256, ttl=900)
+
+def generate_question(generator, topic, difficulty, shuffle_options, deadline):
+    """Generate a single MCQ for create_quiz, raising instead of returning a placeholder"""
+    # generate_mcq already retries bad replies and backs off on API errors;
+    # a failure is raised so create_quiz reports it and keeps only real questions
+    return generator.generate_mcq(
+        topic, difficulty, shuffle_options=shuffle_options, fallback=False, deadline=deadline
+    )
+
+def get_quiz_or_404(share_link, *options):
+    """Load a quiz by share_link through the cached share_link -> id mapping"""
+    quiz_id = quiz_id_cache.get(share_link)
+    if quiz_id is not None:
+        quiz = db.session.get(Quiz, quiz_id, options=options)
+        if quiz is not None and quiz.share_link == share_link:
+            return quiz
+        # Deleted by another worker since the id was cached, and the id may
+        # since have been reused for another quiz (SQLite does this)
+        quiz_id_cache.pop(share_link)
+    
+    quiz_id = db.session.scalar(db.select(Quiz.id).filter_by(share_link=share_link))
+    if quiz_id is None:
+        abort(404)
+    quiz_id_cache.set(share_link, quiz_id)
+    
+    quiz = db.session.get(Quiz, quiz_id, options=options)
+    if quiz is None:
+        abort(404)
+    return quiz
+
 def normalize_answer(answer):
     """Normalize answer for comparison"""
     if not answer:
         return ''
-    answer = str(answer).strip().lower()
-    answer = re.sub(r'\s+', ' ', answer)
-    return answer
+    return ' '.join(str(answer).lower().split())
+
+def normalized_correct_answer(question):
+    """Return the normalized correct answer stored with a question"""
+    normalized = question.get('correct_answer_normalized')
+    if normalized is None:
+        # Quizzes created before answers were pre-normalized lack the field
+        normalized = normalize_answer(question['correct_answer'])
+    return normalized
+
+def question_to_dict(q):
+    """Convert a generated MCQQuestion into the dict stored on Quiz.questions"""
+    return {
+        'question': q.question,
+        'options': q.options,
+        'correct_answer': q.correct_answer,
+        'correct_answer_normalized': normalize_answer(q.correct_answer),
+        'correct_index': q.options.index(q.correct_answer)
+    }
+
+def submitted_option_index(submitted, options):
+    """Return the option index posted by the quiz form, or None for option text"""
+    if not submitted or not submitted.startswith(OPTION_VALUE_PREFIX):
+        return None
+    index = submitted[len(OPTION_VALUE_PREFIX):]
+    if not index.isdecimal() or int(index) >= len(options):
+        return None
+    return int(index)
+
+def grade_answer(question, submitted):
+    """Build the stored answer record for a submitted option index"""
+    options = question['options']
+    correct_index = question.get('correct_index')
+    submitted_index = submitted_option_index(submitted, options)
+    
+    if submitted_index is not None:
+        user_answer = options[submitted_index]
+        if correct_index is not None:
+            is_correct = submitted_index == correct_index
+        else:
+            is_correct = normalize_answer(user_answer) == normalized_correct_answer(question)
+    else:
+        # Pages rendered before options were submitted by index post the option text
+        user_answer = submitted
+        is_correct = normalize_answer(user_answer) == normalized_correct_answer(question)
+    
+    return {
+        'question': question['question'],
+        'user_answer': user_answer,
+        'correct_answer': question['correct_answer'],
+        'is_correct': is_correct
+    }
+
+@app.template_filter('choices')
+def choices_filter(options, shuffle=False):
+    """Pair options with their form value, shuffled for display if requested"""
+    choices = [(f"{OPTION_VALUE_PREFIX}{index}", option) for index, option in enumerate(options)]
+    if shuffle:
+        random.shuffle(choices)
+    return choices
+
+# PDF report styles, built once at import
+PDF_STYLES = getSampleStyleSheet()
+PDF_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=PDF_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#1a5490'),
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+PDF_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=PDF_STYLES['Heading2'],
+    fontSize=16,
+    textColor=colors.HexColor('#2c5aa0'),
+    spaceAfter=12,
+    spaceBefore=12
+)
+
+PDF_QUIZ_INFO_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f0f7')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ccc')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
 
-def create_pdf_report(quiz, attempts):
-    """Create a PDF report for a quiz"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+PDF_STATS_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 1), (-1, -1), 14),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f5fa')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ccc')),
+    ('TOPPADDING', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+])
+
+PDF_RESULTS_HEADER = ['#', 'Student Name', 'Email', 'Score', 'Percentage', 'Date & Time']
+PDF_RESULTS_STYLE = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    # Alternate row colors
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+    ('FONTNAME', (4, 1), (4, -1), 'Helvetica-Bold'),
+]
+
+# Percentage colors in the results table
+PDF_COLOR_EXCELLENT = colors.HexColor('#28a745')
+PDF_COLOR_GOOD = colors.HexColor('#007bff')
+PDF_COLOR_FAIR = colors.HexColor('#ffc107')
+PDF_COLOR_POOR = colors.HexColor('#dc3545')
+
+def percentage_color(percentage):
+    """Return the PDF report color for a score percentage"""
+    if percentage >= 80:
+        return PDF_COLOR_EXCELLENT
+    elif percentage >= 60:
+        return PDF_COLOR_GOOD
+    elif percentage >= 40:
+        return PDF_COLOR_FAIR
+    return PDF_COLOR_POOR
+
+def create_pdf_report(quiz, attempts, out, stats=None):
+    """Write a quiz's PDF report to out, optionally from precomputed (count, average score) stats"""
+    doc = SimpleDocTemplate(out, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
     
     # Container for the 'Flowable' objects
     elements = []
     
-    # Define styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a5490'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#2c5aa0'),
-        spaceAfter=12,
-        spaceBefore=12
-    )
-    
     # Title
-    elements.append(Paragraph("Quiz Report", title_style))
+    elements.append(Paragraph("Quiz Report", PDF_TITLE_STYLE))
     elements.append(Spacer(1, 0.2*inch))
     
     # Quiz Information Table
@@ -134,131 +455,139 @@ def create_pdf_report(quiz, attempts):
         ['Quiz Title:', quiz.title],
         ['Topic:', quiz.topic],
         ['Difficulty:', quiz.difficulty.capitalize()],
-        ['Total Questions:', str(len(quiz.questions))],
+        ['Total Questions:', str(quiz.num_questions)],
         ['Created:', quiz.created_at.strftime("%B %d, %Y at %H:%M")],
     ]
     
     quiz_info_table = Table(quiz_info_data, colWidths=[2*inch, 4.5*inch])
-    quiz_info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f0f7')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ccc')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    quiz_info_table.setStyle(PDF_QUIZ_INFO_STYLE)
     
     elements.append(quiz_info_table)
     elements.append(Spacer(1, 0.3*inch))
     
     # Statistics
-    total_attempts = len(attempts)
+    if stats is not None:
+        total_attempts, avg_score = stats
+    else:
+        total_attempts = len(attempts)
+        avg_score = sum(a.score for a in attempts) / total_attempts if total_attempts else 0
+    
     if total_attempts > 0:
-        avg_score = sum(a.score for a in attempts) / total_attempts
-        avg_percentage = (avg_score / len(quiz.questions)) * 100
+        avg_score = float(avg_score)
+        # num_questions is 0 on rows migrate_db.py has not back-filled yet
+        avg_percentage = (avg_score / quiz.num_questions) * 100 if quiz.num_questions else 0
     else:
         avg_score = 0
         avg_percentage = 0
     
-    elements.append(Paragraph("Statistics Overview", heading_style))
+    elements.append(Paragraph("Statistics Overview", PDF_HEADING_STYLE))
     
     stats_data = [
         ['Total Attempts', 'Average Score', 'Average Percentage'],
-        [str(total_attempts), f"{avg_score:.2f} / {len(quiz.questions)}", f"{avg_percentage:.1f}%"]
+        [str(total_attempts), f"{avg_score:.2f} / {quiz.num_questions}", f"{avg_percentage:.1f}%"]
     ]
     
     stats_table = Table(stats_data, colWidths=[2.2*inch, 2.2*inch, 2.2*inch])
-    stats_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 14),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f5fa')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ccc')),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-    ]))
+    stats_table.setStyle(PDF_STATS_STYLE)
     
     elements.append(stats_table)
     elements.append(Spacer(1, 0.4*inch))
     
     # Student Results
     if attempts:
-        elements.append(Paragraph("Student Results", heading_style))
-        
-        # Table header
-        results_data = [['#', 'Student Name', 'Email', 'Score', 'Percentage', 'Date & Time']]
-        
-        # Add student data
-        for idx, attempt in enumerate(attempts, 1):
-            percentage = (attempt.score / attempt.total_questions) * 100
-            results_data.append([
-                str(idx),
-                attempt.student_name,
-                attempt.student_email or 'N/A',
-                f"{attempt.score}/{attempt.total_questions}",
-                f"{percentage:.1f}%",
-                attempt.completed_at.strftime("%m/%d/%Y %H:%M")
-            ])
+        elements.append(Paragraph("Student Results", PDF_HEADING_STYLE))
         
-        results_table = Table(results_data, colWidths=[0.4*inch, 1.8*inch, 1.8*inch, 0.9*inch, 1*inch, 1.3*inch])
-        
-        # Create table style
-        table_style = [
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]
-        
-        # Alternate row colors
-        for i in range(1, len(results_data)):
-            if i % 2 == 0:
-                table_style.append(('BACKGROUND', (0, i), (-1, i), colors.HexColor('#f9f9f9')))
-            else:
-                table_style.append(('BACKGROUND', (0, i), (-1, i), colors.white))
+        # Emit the results as a series of small tables instead of one large one
+        for start in range(0, len(attempts), PDF_RESULTS_ROWS_PER_TABLE):
+            results_data = [PDF_RESULTS_HEADER]
             
-            # Color code percentages
-            percentage = (attempts[i-1].score / attempts[i-1].total_questions) * 100
-            if percentage >= 80:
-                table_style.append(('TEXTCOLOR', (4, i), (4, i), colors.HexColor('#28a745')))
-                table_style.append(('FONTNAME', (4, i), (4, i), 'Helvetica-Bold'))
-            elif percentage >= 60:
-                table_style.append(('TEXTCOLOR', (4, i), (4, i), colors.HexColor('#007bff')))
-                table_style.append(('FONTNAME', (4, i), (4, i), 'Helvetica-Bold'))
-            elif percentage >= 40:
-                table_style.append(('TEXTCOLOR', (4, i), (4, i), colors.HexColor('#ffc107')))
-                table_style.append(('FONTNAME', (4, i), (4, i), 'Helvetica-Bold'))
-            else:
-                table_style.append(('TEXTCOLOR', (4, i), (4, i), colors.HexColor('#dc3545')))
-                table_style.append(('FONTNAME', (4, i), (4, i), 'Helvetica-Bold'))
-        
-        results_table.setStyle(TableStyle(table_style))
-        elements.append(results_table)
+            # Add student data
+            percentage_colors = []
+            for idx, attempt in enumerate(attempts[start:start + PDF_RESULTS_ROWS_PER_TABLE], start + 1):
+                percentage = (attempt.score / attempt.total_questions) * 100
+                percentage_colors.append(percentage_color(percentage))
+                results_data.append([
+                    str(idx),
+                    attempt.student_name,
+                    attempt.student_email or 'N/A',
+                    f"{attempt.score}/{attempt.total_questions}",
+                    f"{percentage:.1f}%",
+                    attempt.completed_at.strftime("%m/%d/%Y %H:%M")
+                ])
+            
+            results_table = Table(results_data, colWidths=[0.4*inch, 1.8*inch, 1.8*inch, 0.9*inch, 1*inch, 1.3*inch], repeatRows=1)
+            table_style = list(PDF_RESULTS_STYLE)
+            
+            # Color code percentages, one command per run of rows sharing a color
+            row = 1
+            for color, run in groupby(percentage_colors):
+                run_length = len(list(run))
+                table_style.append(('TEXTCOLOR', (4, row), (4, row + run_length - 1), color))
+                row += run_length
+            
+            results_table.setStyle(TableStyle(table_style))
+            elements.append(results_table)
     else:
-        elements.append(Paragraph("No attempts yet.", styles['Normal']))
+        elements.append(Paragraph("No attempts yet.", PDF_STYLES['Normal']))
     
     # Build PDF
     doc.build(elements)
-    buffer.seek(0)
-    return buffer
+
+# PDF reports are built off the request thread; in-flight jobs are keyed by report path
+pdf_report_executor = ThreadPoolExecutor(max_workers=PDF_REPORT_WORKERS)
+_pdf_report_jobs = {}
+_pdf_report_jobs_lock = threading.Lock()
+
+def pdf_report_path(quiz_id, attempt_count, latest_attempt):
+    """Path of the PDF report for a quiz's current set of attempts"""
+    latest = latest_attempt.strftime('%Y%m%d%H%M%S%f') if latest_attempt else 'none'
+    return os.path.join(PDF_REPORT_DIR, f"{quiz_id}-{attempt_count}-{latest}.pdf")
+
+def pdf_report_key(path):
+    """(attempt_count, latest_attempt) sort key encoded in a report's file name"""
+    _, attempt_count, latest = os.path.basename(path)[:-len('.pdf')].split('-')
+    return int(attempt_count), latest
+
+def remove_pdf_reports(quiz_id, older_than=None):
+    """Delete stored PDF reports for a quiz, or only those older than the report at older_than"""
+    for path in glob.glob(os.path.join(PDF_REPORT_DIR, f"{quiz_id}-*.pdf")):
+        if older_than is not None and pdf_report_key(path) >= pdf_report_key(older_than):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def build_pdf_report(quiz_id, path, stats):
+    """Generate a quiz's PDF report and store it at path"""
+    os.makedirs(PDF_REPORT_DIR, exist_ok=True)
+    fd, tmp_path = mkstemp(dir=PDF_REPORT_DIR, suffix='.tmp')
+    try:
+        # Rendered straight into the temporary file, then renamed into place
+        # so a half-written file is never served
+        with os.fdopen(fd, 'wb') as out, app.app_context():
+            quiz = db.session.get(Quiz, quiz_id)
+            attempts = QuizAttempt.query.filter_by(quiz_id=quiz_id).with_entities(
+                QuizAttempt.student_name, QuizAttempt.student_email, QuizAttempt.score,
+                QuizAttempt.total_questions, QuizAttempt.completed_at
+            ).order_by(QuizAttempt.completed_at.desc()).all()
+            create_pdf_report(quiz, attempts, out, stats=stats)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    # A newer report built concurrently may already be served; leave it alone
+    remove_pdf_reports(quiz_id, older_than=path)
+
+def submit_pdf_report(quiz_id, path, stats):
+    """Start building a report unless the same one is already in progress"""
+    with _pdf_report_jobs_lock:
+        future = _pdf_report_jobs.get(path)
+        if future is None:
+            future = pdf_report_executor.submit(build_pdf_report, quiz_id, path, stats)
+            _pdf_report_jobs[path] = future
+            future.add_done_callback(lambda f: _pdf_report_jobs.pop(path, None))
+    return future
 
 # Auth Routes
 @app.route('/register', methods=['GET', 'POST'])
@@ -281,7 +610,7 @@ def register():
         user = User(
             username=username,
             email=email,
-            password=generate_password_hash(password),
+            password=password_hasher.hash(password),
             name=name
         )
         db.session.add(user)
@@ -303,7 +632,17 @@ def login():
         
         user = User.query.filter_by(username=username).first()
         
-        if user and user.password and check_password_hash(user.password, password):
+        # Always check a hash so unknown usernames take as long as wrong passwords
+        password_hash = user.password if user and user.password else _DUMMY_PASSWORD_HASH
+        password_ok, needs_rehash = verify_password(password_hash, password or '')
+        
+        if user and user.password and password_ok:
+            # Upgrade legacy pbkdf2 hashes on the first successful login
+            if needs_rehash:
+                user.password = password_hasher.hash(password)
+                db.session.commit()
+                user_cache.pop(str(user.id))
+            
             login_user(user)
             next_page = request.args.get('next')
             return redirect(next_page) if next_page else redirect(url_for('index'))
@@ -327,23 +666,110 @@ def index():
 @login_required
 def create_quiz():
     if request.method == 'POST':
-        topic = request.form.get('topic')
+        topic = (request.form.get('topic') or '').strip()
         difficulty = request.form.get('difficulty', 'medium')
-        num_questions = int(request.form.get('num_questions', 5))
+        try:
+            num_questions = int(request.form.get('num_questions', 5))
+        except ValueError:
+            num_questions = None
         title = request.form.get('title', f"{topic} Quiz")
         shuffle_options = request.form.get('shuffle_options') == 'on'
         
+        if not topic:
+            return render_template('create_quiz.html', error="Topic cannot be empty")
+        
+        # The form limits this too, but the thread pools are sized from it
+        if num_questions is None or not MIN_QUIZ_QUESTIONS <= num_questions <= MAX_QUIZ_QUESTIONS:
+            return render_template(
+                'create_quiz.html',
+                error=f"Number of questions must be between {MIN_QUIZ_QUESTIONS} and {MAX_QUIZ_QUESTIONS}"
+            )
+        
         try:
-            generator = QuestionGenerator()
-            questions = []
+            generator = get_generator()
+            deadline = time.monotonic() + GENERATION_DEADLINE_SECONDS
+            
+            # Reuse questions kept from an earlier partially failed attempt
+            # Normalized so 'Python  Programming' and 'python programming' share an entry
+            pending_key = (current_user.id, ' '.join(topic.lower().split()), difficulty.lower(), shuffle_options)
+            questions = pending_questions_cache.get(pending_key) or []
+            
+            seen = [question_tokens(q['question']) for q in questions]
+            
+            errors = []
             
-            for _ in range(num_questions):
-                q = generator.generate_mcq(topic, difficulty.lower(), shuffle_options=shuffle_options)
-                questions.append({
-                    'question': q.question,
-                    'options': q.options,
-                    'correct_answer': q.correct_answer
-                })
+            # Batched requests of up to QUESTIONS_PER_BATCH questions cover the
+            # quiz; larger quizzes send several batches concurrently
+            needed = num_questions - len(questions)
+            if needed > 0:
+                batch_sizes = [
+                    min(QUESTIONS_PER_BATCH, needed - start)
+                    for start in range(0, needed, QUESTIONS_PER_BATCH)
+                ]
+                with ThreadPoolExecutor(max_workers=min(len(batch_sizes), MAX_GENERATION_WORKERS)) as executor:
+                    futures = [
+                        executor.submit(
+                            generator.generate_mcqs, topic, difficulty.lower(), size,
+                            shuffle_options=shuffle_options, deadline=deadline
+                        )
+                        for size in batch_sizes
+                    ]
+                    for future in futures:
+                        try:
+                            batch = future.result()
+                        except Exception as e:
+                            errors.append(e)
+                            continue
+                        
+                        for q in batch:
+                            tokens = question_tokens(q.question)
+                            if is_near_duplicate(tokens, seen):
+                                continue
+                            seen.append(tokens)
+                            questions.append(question_to_dict(q))
+            
+            # Top up any shortfall one question per request, concurrently so
+            # the API round-trips overlap; near-duplicates are dropped and
+            # regenerated in the next round
+            for _ in range(MAX_TOPUP_ROUNDS):
+                missing = num_questions - len(questions)
+                if missing <= 0 or errors:
+                    break
+                if time.monotonic() >= deadline:
+                    errors.append(GenerationError("Question generation ran out of time"))
+                    break
+                
+                with ThreadPoolExecutor(max_workers=min(missing, MAX_GENERATION_WORKERS)) as executor:
+                    futures = [
+                        executor.submit(generate_question, generator, topic, difficulty.lower(), shuffle_options, deadline)
+                        for _ in range(missing)
+                    ]
+                    for future in futures:
+                        try:
+                            q = future.result()
+                        except Exception as e:
+                            errors.append(e)
+                            continue
+                        
+                        tokens = question_tokens(q.question)
+                        if is_near_duplicate(tokens, seen):
+                            continue
+                        seen.append(tokens)
+                        questions.append(question_to_dict(q))
+            
+            if len(questions) < num_questions and not errors:
+                errors.append(ValueError("too many duplicate questions"))
+            
+            if errors:
+                pending_questions_cache.set(pending_key, questions)
+                return render_template(
+                    'create_quiz.html',
+                    error=f"Generated {len(questions)} of {num_questions} questions ({errors[0]}). "
+                          "Submit again to generate only the remaining questions."
+                )
+            
+            pending_questions_cache.pop(pending_key)
+            questions = questions[:num_questions]
             
             share_link = secrets.token_urlsafe(8)
             
@@ -353,7 +779,8 @@ def create_quiz():
                 topic=topic,
                 difficulty=difficulty,
                 share_link=share_link,
-                questions=questions
+                questions=questions,
+                num_questions=len(questions)
             )
             
             # Set shuffle_options if column exists
@@ -362,10 +789,19 @@ def create_quiz():
             except:
                 pass  # Column doesn't exist yet, skip it
             
-            db.session.add(quiz)
-            db.session.commit()
+            # share_link is unique; on the rare collision pick a new one and retry
+            for _ in range(SHARE_LINK_ATTEMPTS):
+                try:
+                    db.session.add(quiz)
+                    db.session.commit()
+                    break
+                except IntegrityError:
+                    db.session.rollback()
+                    quiz.share_link = secrets.token_urlsafe(8)
+            else:
+                raise ValueError("Could not generate a unique share link, please try again")
             
-            return redirect(url_for('quiz_created', share_link=share_link))
+            return redirect(url_for('quiz_created', share_link=quiz.share_link))
         
         except Exception as e:
             return render_template('create_quiz.html', error=str(e))
@@ -375,138 +811,177 @@ def create_quiz():
 @app.route('/quiz-created/<share_link>')
 @login_required
 def quiz_created(share_link):
-    quiz = Quiz.query.filter_by(share_link=share_link).first_or_404()
+    quiz = get_quiz_or_404(share_link, undefer(Quiz.questions))
     if quiz.user_id != current_user.id:
         return redirect(url_for('index'))
-    quiz_url = request.host_url + 'quiz/' + share_link
+    quiz_url = url_for('take_quiz', share_link=share_link, _external=True)
     return render_template('quiz_created.html', quiz=quiz, quiz_url=quiz_url)
 
 @app.route('/quiz/<share_link>', methods=['GET', 'POST'])
 def take_quiz(share_link):
-    quiz = Quiz.query.filter_by(share_link=share_link).first_or_404()
+    # Anonymous visitors all get the same page, so it can be served from cache
+    cacheable = request.method == 'GET' and not current_user.is_authenticated
+    if cacheable:
+        html = quiz_page_cache.get(share_link)
+        if html is not None:
+            return html
+    
+    quiz = get_quiz_or_404(share_link, undefer(Quiz.questions))
     
     if request.method == 'POST':
         student_name = request.form.get('student_name')
         student_email = request.form.get('student_email', '')
         
-        score = 0
-        answers = []
+        questions = quiz.questions
+        answers = [
+            grade_answer(question, request.form.get(f'question_{i}'))
+            for i, question in enumerate(questions)
+        ]
         
-        for i, question in enumerate(quiz.questions):
-            user_answer = request.form.get(f'question_{i}')
-            correct_answer = question['correct_answer']
-            
-            user_normalized = normalize_answer(user_answer)
-            correct_normalized = normalize_answer(correct_answer)
-            
-            is_correct = user_normalized == correct_normalized
-            
-            if is_correct:
-                score += 1
-            
-            answers.append({
-                'question': question['question'],
-                'user_answer': user_answer,
-                'correct_answer': correct_answer,
-                'is_correct': is_correct
-            })
+        score = sum(1 for answer in answers if answer['is_correct'])
         
-        attempt = QuizAttempt(
-            quiz_id=quiz.id,
-            student_name=student_name,
-            student_email=student_email,
-            score=score,
-            total_questions=len(quiz.questions),
-            answers=answers
-        )
-        db.session.add(attempt)
+        # An attempt lost in a crash is tolerable, so don't wait on the WAL flush
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(text('SET LOCAL synchronous_commit = off'))
+        
+        # Plain INSERT ... RETURNING, no ORM object to track for a write-only row
+        attempt_id = db.session.execute(
+            insert(QuizAttempt).values(
+                quiz_id=quiz.id,
+                student_name=student_name,
+                student_email=student_email,
+                score=score,
+                total_questions=len(questions),
+                answers=answers
+            ).returning(QuizAttempt.id)
+        ).scalar_one()
         db.session.commit()
         
-        return redirect(url_for('quiz_results', attempt_id=attempt.id))
-    
-    # Shuffle options if enabled (for display only)
-    display_questions = []
-    import random
-    for question in quiz.questions:
-        q_copy = question.copy()
-        if quiz.shuffle_options:
-            # Create a copy and shuffle the options
-            options_copy = q_copy['options'].copy()
-            random.shuffle(options_copy)
-            q_copy['options'] = options_copy
-        display_questions.append(q_copy)
-    
-    return render_template('take_quiz.html', quiz=quiz, questions=display_questions)
+        return redirect(url_for('quiz_results', attempt_id=attempt_id))
+    
+    html = render_template('take_quiz.html', quiz=quiz, questions=quiz.questions)
+    # Shuffled quizzes must render a fresh option order for every visitor
+    if cacheable and not quiz.shuffle_options:
+        quiz_page_cache.set(share_link, html)
+    return html
 
 @app.route('/results/<int:attempt_id>')
 def quiz_results(attempt_id):
-    attempt = QuizAttempt.query.get_or_404(attempt_id)
+    attempt = db.get_or_404(QuizAttempt, attempt_id)
     percentage = (attempt.score / attempt.total_questions) * 100
     return render_template('results.html', attempt=attempt, percentage=percentage)
 
 @app.route('/my-quizzes')
 @login_required
 def my_quizzes():
-    quizzes = Quiz.query.filter_by(user_id=current_user.id).order_by(Quiz.created_at.desc()).all()
+    # Aggregate attempts in SQL so they aren't lazy-loaded per quiz
+    quizzes = db.session.query(
+        Quiz,
+        func.count(QuizAttempt.id),
+        func.avg(QuizAttempt.score)
+    ).outerjoin(
+        QuizAttempt, QuizAttempt.quiz_id == Quiz.id
+    ).filter(
+        Quiz.user_id == current_user.id
+    ).group_by(Quiz.id).order_by(Quiz.created_at.desc()).all()
     return render_template('my_quizzes.html', quizzes=quizzes)
 
 @app.route('/quiz-report/<share_link>')
 @login_required
 def quiz_report(share_link):
-    quiz = Quiz.query.filter_by(share_link=share_link).first_or_404()
+    quiz = get_quiz_or_404(share_link)
     if quiz.user_id != current_user.id:
         return redirect(url_for('index'))
     
-    attempts = QuizAttempt.query.filter_by(quiz_id=quiz.id).order_by(QuizAttempt.completed_at.desc()).all()
+    num_questions = quiz.num_questions
     
-    total_attempts = len(attempts)
-    if total_attempts > 0:
-        avg_score = sum(a.score for a in attempts) / total_attempts
-        avg_percentage = (avg_score / len(quiz.questions)) * 100
+    # Aggregate over all attempts here since the listing below is paginated
+    total_attempts, avg_score, perfect_count, pass_count = db.session.query(
+        func.count(QuizAttempt.id),
+        func.avg(QuizAttempt.score),
+        func.coalesce(func.sum(case((QuizAttempt.score == num_questions, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((QuizAttempt.score >= num_questions * 0.6, 1), else_=0)), 0)
+    ).filter(QuizAttempt.quiz_id == quiz.id).one()
+    
+    # num_questions is 0 on rows migrate_db.py has not back-filled yet
+    if total_attempts > 0 and num_questions:
+        avg_percentage = (float(avg_score) / num_questions) * 100
     else:
-        avg_score = 0
         avg_percentage = 0
     
+    # Skip the answers JSON column, the listing only needs the summary fields
+    pagination = QuizAttempt.query.with_entities(
+        QuizAttempt.id,
+        QuizAttempt.student_name,
+        QuizAttempt.student_email,
+        QuizAttempt.score,
+        QuizAttempt.total_questions,
+        QuizAttempt.completed_at
+    ).filter_by(quiz_id=quiz.id).order_by(QuizAttempt.completed_at.desc()).paginate(
+        page=request.args.get('page', 1, type=int),
+        per_page=REPORT_ATTEMPTS_PER_PAGE
+    )
+    
     return render_template('quiz_report.html', 
                          quiz=quiz, 
-                         attempts=attempts, 
+                         attempts=pagination.items, 
+                         pagination=pagination,
                          total_attempts=total_attempts,
-                         avg_percentage=avg_percentage)
+                         avg_percentage=avg_percentage,
+                         perfect_count=perfect_count,
+                         pass_count=pass_count)
 
 @app.route('/download-report/<share_link>')
 @login_required
 def download_report(share_link):
-    quiz = Quiz.query.filter_by(share_link=share_link).first_or_404()
+    quiz = get_quiz_or_404(share_link)
     if quiz.user_id != current_user.id:
         return redirect(url_for('index'))
     
-    attempts = QuizAttempt.query.filter_by(quiz_id=quiz.id).order_by(QuizAttempt.completed_at.desc()).all()
+    # The report only changes when attempts are added, so key the stored PDF on them
+    attempt_count, avg_score, latest_attempt = db.session.query(
+        func.count(QuizAttempt.id), func.avg(QuizAttempt.score), func.max(QuizAttempt.completed_at)
+    ).filter(QuizAttempt.quiz_id == quiz.id).one()
+    path = pdf_report_path(quiz.id, attempt_count, latest_attempt)
     
-    # Generate PDF file
-    pdf_file = create_pdf_report(quiz, attempts)
+    if not os.path.exists(path):
+        future = submit_pdf_report(quiz.id, path, (attempt_count, avg_score))
+        # Small reports are ready almost at once; for large ones show a page that retries
+        try:
+            future.result(timeout=PDF_INLINE_WAIT_SECONDS)
+        except FutureTimeoutError:
+            return render_template('report_pending.html', quiz=quiz), 202
     
     # Create filename
     filename = f"{quiz.title.replace(' ', '_')}_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
     
-    return send_file(
-        pdf_file,
-        mimetype='application/pdf',
-        as_attachment=True,
-        download_name=filename
-    )
+    try:
+        return send_file(
+            path,
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=filename
+        )
+    except FileNotFoundError:
+        # Removed between the check and the send; rebuild and let the page retry
+        submit_pdf_report(quiz.id, path, (attempt_count, avg_score))
+        return render_template('report_pending.html', quiz=quiz), 202
 
 @app.route('/delete-quiz/<int:quiz_id>', methods=['POST'])
 @login_required
 def delete_quiz(quiz_id):
-    quiz = Quiz.query.get_or_404(quiz_id)
+    quiz = Quiz.query.options(load_only(Quiz.id, Quiz.user_id, Quiz.share_link)).filter_by(id=quiz_id).first_or_404()
     if quiz.user_id != current_user.id:
         return redirect(url_for('index'))
+    # Delete attempts in one statement instead of loading each one for the ORM cascade
+    QuizAttempt.query.filter_by(quiz_id=quiz.id).delete(synchronize_session=False)
     db.session.delete(quiz)
     db.session.commit()
+    quiz_page_cache.pop(quiz.share_link)
+    quiz_id_cache.pop(quiz.share_link)
+    remove_pdf_reports(quiz.id)
     return redirect(url_for('my_quizzes'))
 
-import os
-
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(
@@ -1,15 +1,118 @@
 import os
 import time
-import json
+import orjson
 import random
+import threading
+import logging
 from dotenv import load_dotenv
-import google.generativeai as genai
 from pydantic import BaseModel, field_validator, Field, ValidationError
 from typing import List
 import re
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Errors worth waiting out: throttling (429 / quota) and transient server or
+# network failures from the Gemini API
+TRANSIENT_ERROR_PATTERN = re.compile(
+    r"(\b(429|500|502|503|504)\b|rate.?limit|resource.?exhausted|"
+    r"unavailable|deadline.?exceeded|timed?.?out|connection.?(reset|aborted))",
+    re.IGNORECASE
+)
+
+# JSON object in a model reply: a ```json fenced block, or else the span from
+# the first { to the last }
+JSON_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+# Raw control characters (e.g. newlines inside strings) are invalid in JSON
+CONTROL_CHARS_TO_SPACE = str.maketrans({chr(c): ' ' for c in range(32)})
+
+# Output tokens budgeted per question in a batched request; the model-wide
+# max_output_tokens of 1024 is sized for a single question
+BATCH_TOKENS_PER_QUESTION = 300
+
+# Hard questions use the full model; easy and medium ones a smaller, faster one
+DEFAULT_MODEL = os.getenv("GEMINI_MODEL", "models/gemini-2.5-flash")
+FAST_MODEL = os.getenv("GEMINI_FAST_MODEL", "models/gemini-2.5-flash-lite")
+FAST_MODEL_DIFFICULTIES = ('easy', 'medium')
+
+# Prompts for generate_mcq and generate_mcqs; literal braces are doubled for
+# format_map. The fixed instructions come first and the per-call topic and
+# difficulty last, so every request shares the same prompt prefix.
+MCQ_PROMPT_TEMPLATE = (
+    "You write multiple-choice quiz questions.\n"
+    "Output ONLY a valid JSON object with no additional text, markdown, or explanations.\n"
+    "Use this EXACT structure:\n\n"
+    "{{\n"
+    '  "q": "Your question text here?",\n'
+    '  "o": ["Option A", "Option B", "Option C", "Option D"],\n'
+    '  "a": 0\n'
+    "}}\n\n"
+    "Requirements:\n"
+    "- Provide exactly 4 distinct options in \"o\"\n"
+    "- \"a\" is the 0-based index of the correct option in \"o\"\n"
+    "- Vary the position of the correct option\n"
+    "- Keep all text simple and avoid special characters\n"
+    "- Do not include any text before or after the JSON\n\n"
+    "Now create a {difficulty} question about: {topic}\n"
+)
+
+BATCH_MCQ_PROMPT_TEMPLATE = (
+    "You write multiple-choice quiz questions.\n"
+    "Output ONLY a valid JSON object with no additional text, markdown, or explanations.\n"
+    "Use this EXACT structure:\n\n"
+    "{{\n"
+    '  "questions": [\n'
+    "    {{\n"
+    '      "q": "Your question text here?",\n'
+    '      "o": ["Option A", "Option B", "Option C", "Option D"],\n'
+    '      "a": 0\n'
+    "    }}\n"
+    "  ]\n"
+    "}}\n\n"
+    "Requirements:\n"
+    "- No question may repeat another\n"
+    "- Provide exactly 4 distinct options per question in \"o\"\n"
+    "- \"a\" is the 0-based index of the correct option in \"o\"\n"
+    "- Vary the position of the correct option\n"
+    "- Keep all text simple and avoid special characters\n"
+    "- Do not include any text before or after the JSON\n\n"
+    "Now create exactly {count} distinct {difficulty} questions about: {topic}\n"
+)
+
+# Appended to the prompt when a retry follows an unparseable or invalid reply
+CORRECTIVE_PROMPT_SUFFIX = (
+    "\nYour previous reply was not a valid JSON object in the structure above. "
+    "Output ONLY the JSON object.\n"
+)
+
+# Fixed parts of the placeholder question used when generation keeps failing
+FALLBACK_DIFFICULTY_DESC = {'easy': 'basic', 'medium': 'intermediate', 'hard': 'advanced'}
+FALLBACK_DISTRACTORS = (
+    "Advanced theories in mathematics",
+    "Historical events in ancient Rome",
+    "Chemical properties of water",
+)
+
+# Questions sharing at least this fraction of their words count as duplicates
+DUPLICATE_SIMILARITY = 0.85
+
+def question_tokens(text: str) -> frozenset:
+    """Word set of a question, used for near-duplicate detection"""
+    return frozenset(re.findall(r"\w+", text.lower()))
+
+def is_near_duplicate(tokens: frozenset, seen: list) -> bool:
+    """Check whether tokens has Jaccard similarity >= DUPLICATE_SIMILARITY with any seen word set"""
+    for other in seen:
+        union = len(tokens | other)
+        if union and len(tokens & other) / union >= DUPLICATE_SIMILARITY:
+            return True
+    return False
+
+class GenerationError(Exception):
+    """Raised when a question could not be generated and no fallback was requested"""
+
 class MCQQuestion(BaseModel):   
     question: str = Field(description="The question text")
     options: List[str] = Field(description="List of 4 possible answers")
@@ -47,110 +150,216 @@ class QuestionGenerator:
             raise ValueError("GOOGLE_API_KEY not found in environment variables")
         
         try:
+            # Imported here so the Gemini SDK only loads once a generator is needed
+            import google.generativeai as genai
             genai.configure(api_key=api_key)
             
+            generation_config = {
+                "temperature": 0.7,
+                "top_p": 0.95,
+                "top_k": 40,
+                "max_output_tokens": 1024,
+            }
             self.model = genai.GenerativeModel(
-                model_name="models/gemini-2.5-flash",  # or "models/gemini-2.5-pro"
-                generation_config={
-                    "temperature": 0.7,
-                    "top_p": 0.95,
-                    "top_k": 40,
-                    "max_output_tokens": 1024,
-                }
+                model_name=DEFAULT_MODEL,  # or "models/gemini-2.5-pro"
+                generation_config=generation_config
             )
-
-
-            # Test the model
-            test_response = self.model.generate_content("Return JSON: {\"test\": \"ok\"}")
-            test_text = self._get_response_text(test_response)
-            if test_text:
-                print(f"✓ AI Model initialized successfully")
+            if FAST_MODEL != DEFAULT_MODEL:
+                self.fast_model = genai.GenerativeModel(
+                    model_name=FAST_MODEL,
+                    generation_config=generation_config
+                )
             else:
-                raise ValueError("Model test failed")
+                self.fast_model = self.model
             
         except Exception as e:
             raise ValueError(f"Failed to initialize AI model: {str(e)}")
         
-        self.last_call_time = 0
-        self.min_call_interval = 2.0
+        # The test request runs on first use (ensure_ready), not at startup
+        self._ready = False
+        self._ready_lock = threading.Lock()
+        
+        # Process-wide request budget (token bucket), shared by all request threads
+        self.calls_per_second = float(os.getenv("QUIZ_GEN_RPS", "0.5"))
+        self.burst = max(1, int(os.getenv("QUIZ_GEN_BURST", "1")))
+        self._next_call_time = 0.0
+        self._rate_limit_lock = threading.Lock()
+        
+        # Exponential backoff for transient API errors
+        self.max_transient_retries = 3
+        self.backoff_base = 1.0
+        self.backoff_max_wait = 8.0
+    
+    def ensure_ready(self):
+        """Send a one-off test request before the model's first real use"""
+        if self._ready:
+            return
+        
+        with self._ready_lock:
+            if self._ready:
+                return
+            
+            try:
+                # Through _generate_content so a throttled first call backs off
+                test_response = self._generate_content("Return JSON: {\"test\": \"ok\"}")
+                test_text = self._get_response_text(test_response)
+            except Exception as e:
+                raise ValueError(f"Failed to initialize AI model: {str(e)}")
+            
+            if not test_text:
+                raise ValueError("Failed to initialize AI model: Model test failed")
+            
+            logger.info("AI model initialized")
+            self._ready = True
     
     def _get_response_text(self, response) -> str:
         """Safely extract text from Gemini response"""
+        # Read the first candidate's parts directly; response.text raises on
+        # blocked or empty replies
         try:
-            # Try the simple accessor first
-            if hasattr(response, 'text') and response.text:
-                return response.text
-        except:
-            pass
-        
-        try:
-            # Try accessing parts
-            if hasattr(response, 'parts') and response.parts:
-                return ''.join(part.text for part in response.parts if hasattr(part, 'text'))
-        except:
-            pass
-        
-        try:
-            # Try the full path
-            if hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'content') and hasattr(candidate.content, 'parts'):
-                    return ''.join(part.text for part in candidate.content.parts if hasattr(part, 'text'))
-        except:
-            pass
-        
-        return ""
+            return ''.join(part.text for part in response.candidates[0].content.parts)
+        except (AttributeError, IndexError, TypeError):
+            return ""
     
-    def _rate_limit(self):
+    def _rate_limit(self, deadline=None):
         """Ensure we don't overwhelm the API with rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_call_time
-        if time_since_last < self.min_call_interval:
-            sleep_time = self.min_call_interval - time_since_last
+        # Token bucket in its virtual-scheduling form: up to `burst` calls may
+        # go at once, after that one call per 1/calls_per_second. The slot is
+        # reserved under the lock and slept on outside it, so concurrent
+        # callers are spaced out without blocking each other
+        interval = 1.0 / self.calls_per_second
+        with self._rate_limit_lock:
+            current_time = time.monotonic()
+            next_call_time = max(current_time, self._next_call_time)
+            call_time = next_call_time - (self.burst - 1) * interval
+            # Don't reserve a slot the caller could not wait for
+            if deadline is not None and call_time > deadline:
+                raise GenerationError("Question generation ran out of time")
+            self._next_call_time = next_call_time + interval
+        sleep_time = call_time - current_time
+        if sleep_time > 0:
             time.sleep(sleep_time)
-        self.last_call_time = time.time()
+    
+    def _model_for(self, difficulty: str):
+        """Pick the model for a difficulty level"""
+        return self.fast_model if difficulty in FAST_MODEL_DIFFICULTIES else self.model
+    
+    def _generate_content(self, prompt: str, model=None, deadline=None, **kwargs):
+        """Call the model under the rate limit, backing off exponentially on transient API errors.
+        
+        deadline is a time.monotonic() value; once no call can start before
+        it, GenerationError is raised instead of waiting.
+        """
+        model = model or self.model
+        for retry in range(self.max_transient_retries + 1):
+            # Every request, including retries, draws from the shared budget
+            self._rate_limit(deadline)
+            try:
+                return model.generate_content(prompt, **kwargs)
+            except Exception as e:
+                # Only throttling and outages clear up by waiting; let other errors surface now
+                if retry == self.max_transient_retries or not (
+                    isinstance(e, TimeoutError) or TRANSIENT_ERROR_PATTERN.search(str(e))
+                ):
+                    raise
+                wait_time = min(self.backoff_max_wait, self.backoff_base * 2 ** retry) + random.uniform(0, 0.25)
+                if deadline is not None and time.monotonic() + wait_time > deadline:
+                    raise
+                logger.warning("Transient API error, retrying in %.1fs: %s", wait_time, e)
+                time.sleep(wait_time)
     
     def _extract_json(self, content: str) -> dict:
         """Extract JSON from various response formats with improved handling"""
         if not content or not content.strip():
             raise ValueError("Empty content received")
         
-        content = content.strip()
-        
-        # Remove markdown code blocks
-        content = re.sub(r'^```json\s*', '', content)
-        content = re.sub(r'^```\s*', '', content)
-        content = re.sub(r'\s*```$', '', content)
-        content = content.strip()
-        
-        # Try to find JSON object boundaries
-        # Look for the first { and last }
-        start_idx = content.find('{')
-        end_idx = content.rfind('}')
+        # Take the fenced block if the reply has one, otherwise the outermost braces
+        match = JSON_BLOCK_PATTERN.search(content)
+        if not match:
+            raise ValueError(f"No JSON object found in response: {content.strip()[:100]}")
         
-        if start_idx == -1 or end_idx == -1:
-            raise ValueError(f"No JSON object found in response: {content[:100]}")
+        json_str = match.group(1) or match.group(2)
         
-        json_str = content[start_idx:end_idx + 1]
+        # Well-formed replies parse as-is; only pay for the cleanup pass if not
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
         
         # Clean up any control characters that might break JSON parsing
-        json_str = json_str.replace('\n', ' ').replace('\r', ' ')
-        json_str = re.sub(r'\s+', ' ', json_str)
+        json_str = json_str.translate(CONTROL_CHARS_TO_SPACE)
         
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
             # If direct parsing fails, try to fix common issues
             # Fix unescaped quotes in strings
             try:
                 # This is a basic fix - might need more sophisticated handling
                 fixed_json = json_str.replace('\\"', '"')
-                return json.loads(fixed_json)
+                return orjson.loads(fixed_json)
             except:
                 raise ValueError(f"JSON parsing failed: {str(e)}. Content: {json_str[:200]}")
     
-    def generate_mcq(self, topic: str, difficulty: str = 'medium', shuffle_options: bool = False) -> MCQQuestion:
-        """Generate MCQ with robust error handling and validation"""
+    def _expand_compact_mcq(self, json_data: dict) -> dict:
+        """Map a compact {"q", "o", "a"} MCQ onto MCQQuestion's field names"""
+        options = json_data.get('o')
+        answer = json_data.get('a')
+        if not isinstance(options, list) or not isinstance(answer, int) or not 0 <= answer < len(options):
+            raise ValueError(f"Invalid correct answer index: {answer!r}")
+        
+        return {
+            'question': json_data.get('q'),
+            'options': options,
+            'correct_answer': options[answer],
+        }
+    
+    def _parse_mcq(self, json_data: dict) -> MCQQuestion:
+        """Validate a decoded MCQ object and normalize its correct answer"""
+        if not isinstance(json_data, dict):
+            raise ValueError(f"Expected a JSON object, got {type(json_data).__name__}")
+        
+        # The prompts ask for the compact {"q", "o", "a"} form to save output tokens
+        if 'question' not in json_data and 'q' in json_data:
+            json_data = self._expand_compact_mcq(json_data)
+        
+        # Validate JSON structure
+        required_keys = ['question', 'options', 'correct_answer']
+        if not all(key in json_data for key in required_keys):
+            missing = [k for k in required_keys if k not in json_data]
+            raise ValueError(f"Missing required fields: {missing}")
+        
+        # Create and validate MCQ object
+        parsed_response = MCQQuestion.model_validate(json_data)
+        
+        # Additional validation
+        if len(parsed_response.options) != 4:
+            raise ValueError(f"Expected 4 options, got {len(parsed_response.options)}")
+        
+        # One case-insensitive pass covers both duplicate options and the answer match
+        lowers = [opt.lower().strip() for opt in parsed_response.options]
+        if len(set(lowers)) != 4:
+            raise ValueError("Duplicate options found")
+        
+        try:
+            match_index = lowers.index(parsed_response.correct_answer.lower().strip())
+        except ValueError:
+            raise ValueError(f"Correct answer '{parsed_response.correct_answer}' not found in options")
+        
+        # Use the matched option for consistency
+        parsed_response.correct_answer = parsed_response.options[match_index]
+        
+        return parsed_response
+    
+    def generate_mcq(self, topic: str, difficulty: str = 'medium', shuffle_options: bool = False,
+                     fallback: bool = True, deadline: float = None) -> MCQQuestion:
+        """Generate MCQ with robust error handling and validation.
+        
+        If every attempt fails, returns a placeholder question. With
+        fallback False, malformed replies raise GenerationError and API
+        errors are re-raised. Running past deadline (a time.monotonic()
+        value) always raises GenerationError.
+        """
         if not topic or not topic.strip():
             raise ValueError("Topic cannot be empty")
         
@@ -158,32 +367,20 @@ class QuestionGenerator:
         if difficulty not in ['easy', 'medium', 'hard']:
             difficulty = 'medium'
         
-        self._rate_limit()
-        
-        # Simplified prompt that emphasizes JSON-only output
-        prompt = (
-            f"Create a {difficulty} multiple-choice question about {topic}.\n\n"
-            "Output ONLY a valid JSON object with no additional text, markdown, or explanations.\n"
-            "Use this EXACT structure:\n\n"
-            "{\n"
-            '  "question": "Your question text here?",\n'
-            '  "options": ["Option A", "Option B", "Option C", "Option D"],\n'
-            '  "correct_answer": "Option A"\n'
-            "}\n\n"
-            "Requirements:\n"
-            "- Provide exactly 4 distinct options\n"
-            "- The correct_answer must match one of the options exactly\n"
-            "- Keep all text simple and avoid special characters\n"
-            "- Do not include any text before or after the JSON\n"
-        )
+        self.ensure_ready()
+        
+        base_prompt = MCQ_PROMPT_TEMPLATE.format_map({"topic": topic, "difficulty": difficulty})
+        prompt = base_prompt
 
+        # Transient API errors are backed off inside _generate_content, so a
+        # malformed reply is retried straight away with a corrective prompt
         max_attempts = 3
         last_error = None
         
         for attempt in range(max_attempts):
             try:
                 # Generate response using Gemini
-                response = self.model.generate_content(prompt)
+                response = self._generate_content(prompt, model=self._model_for(difficulty), deadline=deadline)
                 
                 # Get response text using safe accessor
                 response_text = self._get_response_text(response)
@@ -194,86 +391,139 @@ class QuestionGenerator:
                 # Extract and parse JSON
                 json_data = self._extract_json(response_text)
                 
-                # Validate JSON structure
-                required_keys = ['question', 'options', 'correct_answer']
-                if not all(key in json_data for key in required_keys):
-                    missing = [k for k in required_keys if k not in json_data]
-                    raise ValueError(f"Missing required fields: {missing}")
-                
-                # Create and validate MCQ object
-                parsed_response = MCQQuestion(**json_data)
-                
-                # Additional validation
-                if len(parsed_response.options) != 4:
-                    raise ValueError(f"Expected 4 options, got {len(parsed_response.options)}")
-                
-                # Check if correct answer is in options (case-insensitive match)
-                correct_lower = parsed_response.correct_answer.lower().strip()
-                option_match = None
-                
-                for option in parsed_response.options:
-                    if option.lower().strip() == correct_lower:
-                        option_match = option
-                        break
-                
-                if not option_match:
-                    raise ValueError(f"Correct answer '{parsed_response.correct_answer}' not found in options")
-                
-                # Use the matched option for consistency
-                parsed_response.correct_answer = option_match
-                
-                # Check for duplicate options
-                unique_options = set(opt.lower().strip() for opt in parsed_response.options)
-                if len(unique_options) != 4:
-                    raise ValueError("Duplicate options found")
+                parsed_response = self._parse_mcq(json_data)
                 
                 # Shuffle options if requested
                 if shuffle_options:
                     parsed_response.shuffle_options()
                 
                 # Success!
-                print(f"✓ Generated question for '{topic}' (attempt {attempt + 1})")
+                logger.debug("Generated question for %r (attempt %d)", topic, attempt + 1)
                 return parsed_response
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 last_error = f"JSON parsing error: {str(e)}"
-                print(f"✗ Attempt {attempt + 1} failed: {last_error}")
+                logger.warning("Attempt %d failed: %s", attempt + 1, last_error)
+                prompt = base_prompt + CORRECTIVE_PROMPT_SUFFIX
                 
             except ValidationError as e:
                 last_error = f"Validation error: {str(e)}"
-                print(f"✗ Attempt {attempt + 1} failed: {last_error}")
+                logger.warning("Attempt %d failed: %s", attempt + 1, last_error)
+                prompt = base_prompt + CORRECTIVE_PROMPT_SUFFIX
+                
+            except ValueError as e:
+                last_error = f"Invalid response: {str(e)}"
+                logger.warning("Attempt %d failed: %s", attempt + 1, last_error)
+                prompt = base_prompt + CORRECTIVE_PROMPT_SUFFIX
+                
+            except GenerationError:
+                raise  # Out of time, no point in another attempt
                 
             except Exception as e:
-                last_error = f"Unexpected error: {str(e)}"
-                print(f"✗ Attempt {attempt + 1} failed: {last_error}")
-            
-            # Wait before retry (exponential backoff)
-            if attempt < max_attempts - 1:
-                wait_time = (attempt + 1) * 2.0
-                print(f"  Retrying in {wait_time}s...")
-                time.sleep(wait_time)
+                # An API error _generate_content did not treat as transient, or
+                # one that outlasted its backoff; another attempt won't help
+                if not fallback:
+                    raise
+                last_error = f"API error: {str(e)}"
+                logger.warning("Attempt %d failed: %s", attempt + 1, last_error)
+                break
+        
+        if not fallback:
+            raise GenerationError(f"Question generation failed: {last_error}")
         
         # All attempts failed, use fallback
-        print(f"⚠ All attempts failed. Using fallback question. Last error: {last_error}")
+        logger.warning("All attempts failed. Using fallback question. Last error: %s", last_error)
         return self._create_fallback_mcq(topic, difficulty, shuffle_options)
 
+    def generate_mcqs(self, topic: str, difficulty: str = 'medium', count: int = 5,
+                      shuffle_options: bool = False, deadline: float = None) -> List[MCQQuestion]:
+        """Generate several MCQs with a single API request.
+        
+        Returns only the questions that pass validation, which may be fewer
+        than requested (or none if every reply is malformed). Callers top up
+        any shortfall with generate_mcq. API errors are raised, and running
+        past deadline raises GenerationError.
+        """
+        if not topic or not topic.strip():
+            raise ValueError("Topic cannot be empty")
+        
+        difficulty = difficulty.lower()
+        if difficulty not in ['easy', 'medium', 'hard']:
+            difficulty = 'medium'
+        
+        if count <= 0:
+            return []
+        
+        self.ensure_ready()
+        
+        base_prompt = BATCH_MCQ_PROMPT_TEMPLATE.format_map(
+            {"topic": topic, "difficulty": difficulty, "count": count}
+        )
+        prompt = base_prompt
+        
+        generation_config = {
+            "max_output_tokens": max(1024, count * BATCH_TOKENS_PER_QUESTION)
+        }
+        
+        max_attempts = 2
+        last_error = None
+        
+        for attempt in range(max_attempts):
+            try:
+                response = self._generate_content(
+                    prompt, model=self._model_for(difficulty), deadline=deadline,
+                    generation_config=generation_config
+                )
+                response_text = self._get_response_text(response)
+                
+                if not response_text:
+                    raise ValueError("Empty response from AI")
+                
+                items = self._extract_json(response_text).get('questions')
+                if not isinstance(items, list):
+                    raise ValueError("Response has no 'questions' list")
+                
+                questions = []
+                seen = []
+                for item in items[:count]:
+                    try:
+                        parsed = self._parse_mcq(item)
+                    except (ValueError, ValidationError) as e:
+                        logger.warning("Skipping invalid batch question: %s", e)
+                        continue
+                    
+                    tokens = question_tokens(parsed.question)
+                    if is_near_duplicate(tokens, seen):
+                        continue
+                    seen.append(tokens)
+                    
+                    if shuffle_options:
+                        parsed.shuffle_options()
+                    questions.append(parsed)
+                
+                if not questions:
+                    raise ValueError("No valid questions in batch response")
+                
+                logger.debug("Generated %d/%d questions for %r in one request", len(questions), count, topic)
+                return questions
+                
+            except (ValueError, ValidationError) as e:
+                last_error = str(e)
+                logger.warning("Batch attempt %d failed: %s", attempt + 1, last_error)
+                prompt = base_prompt + CORRECTIVE_PROMPT_SUFFIX
+        
+        logger.warning("Batch generation failed, falling back to single questions. Last error: %s", last_error)
+        return []
+    
     def _create_fallback_mcq(self, topic: str, difficulty: str, shuffle_options: bool = False) -> MCQQuestion:
         """Create a reasonable fallback MCQ when API fails"""
-        difficulty_desc = {
-            'easy': 'basic',
-            'medium': 'intermediate',
-            'hard': 'advanced'
-        }.get(difficulty, 'general')
+        difficulty_desc = FALLBACK_DIFFICULTY_DESC.get(difficulty, 'general')
+        correct = f"Fundamental concepts of {topic}"
         
         question = MCQQuestion(
             question=f"Which of the following best describes a {difficulty_desc} aspect of {topic}?",
-            options=[
-                f"Fundamental concepts of {topic}",
-                f"Advanced theories in mathematics",
-                f"Historical events in ancient Rome",
-                f"Chemical properties of water"
-            ],
-            correct_answer=f"Fundamental concepts of {topic}"
+            options=[correct, *FALLBACK_DISTRACTORS],
+            correct_answer=correct
         )
         
         if shuffle_options:
@@ -299,6 +549,7 @@ class QuestionGenerator:
                 print("GOOGLE_API_KEY not found")
                 return []
             
+            import google.generativeai as genai
             genai.configure(api_key=api_key)
             print("\nAvailable Gemini models that support generateContent:")
             available_models = []
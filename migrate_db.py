@@ -1,51 +1,145 @@
 """
 Database Migration Script
-Run this once to add the shuffle_options column to existing database
+Run this once to add the shuffle_options column and lookup indexes to existing database,
+convert the JSON columns to JSONB, add num_questions, and back-fill precomputed answer fields.
+Required on databases created before num_questions existed: until it is back-filled,
+those quizzes show a question count and average of 0.
 """
 
-from app import app, db
+import os
+
+# Schema changes and back-fills can run far longer than the app's per-query cap
+os.environ['DB_STATEMENT_TIMEOUT_MS'] = '0'
+
+from app import app, db, Quiz, normalize_answer
 from sqlalchemy import text
+from sqlalchemy.orm import undefer
 
 def migrate_database():
     """Add shuffle_options column to quiz table"""
     with app.app_context():
         try:
-            # Check if column already exists
-            result = db.session.execute(text(
-                "SELECT column_name FROM information_schema.columns "
-                "WHERE table_name='quiz' AND column_name='shuffle_options'"
+            print("Adding 'shuffle_options' column to quiz table...")
+            db.session.execute(text(
+                "ALTER TABLE quiz ADD COLUMN IF NOT EXISTS shuffle_options BOOLEAN DEFAULT FALSE"
+            ))
+            db.session.commit()
+            print("✓ shuffle_options column ready!")
+                
+        except Exception as e:
+            print(f"✗ Migration failed: {str(e)}")
+            db.session.rollback()
+
+def add_indexes():
+    """Add indexes on share_link and the foreign key + sort columns"""
+    with app.app_context():
+        try:
+            print("Adding lookup indexes...")
+            db.session.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ix_quiz_share_link ON quiz (share_link)"
+            ))
+            db.session.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_quiz_user_id_created_at "
+                "ON quiz (user_id, created_at DESC)"
+            ))
+            db.session.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_quiz_attempt_quiz_id_completed_at "
+                "ON quiz_attempt (quiz_id, completed_at DESC)"
             ))
             
-            if result.fetchone():
-                print("✓ Column 'shuffle_options' already exists!")
-                return
+            # Superseded by the composite indexes above
+            db.session.execute(text("DROP INDEX IF EXISTS ix_quiz_user_id"))
+            db.session.execute(text("DROP INDEX IF EXISTS ix_quiz_attempt_quiz_id"))
+            db.session.commit()
+            print("✓ Indexes added successfully!")
             
-            # Add the column
-            print("Adding 'shuffle_options' column to quiz table...")
+        except Exception as e:
+            print(f"✗ Index migration failed: {str(e)}")
+            db.session.rollback()
+
+def convert_json_columns():
+    """Convert questions and answers columns from JSON to JSONB"""
+    with app.app_context():
+        try:
+            print("Converting JSON columns to JSONB...")
+            db.session.execute(text(
+                "ALTER TABLE quiz ALTER COLUMN questions TYPE JSONB USING questions::jsonb"
+            ))
             db.session.execute(text(
-                "ALTER TABLE quiz ADD COLUMN shuffle_options BOOLEAN DEFAULT FALSE"
+                "ALTER TABLE quiz_attempt ALTER COLUMN answers TYPE JSONB USING answers::jsonb"
             ))
             db.session.commit()
-            print("✓ Column added successfully!")
+            print("✓ JSON columns converted successfully!")
             
-            # Verify the column was added
-            result = db.session.execute(text(
-                "SELECT column_name FROM information_schema.columns "
-                "WHERE table_name='quiz' AND column_name='shuffle_options'"
+        except Exception as e:
+            print(f"✗ JSONB conversion failed: {str(e)}")
+            db.session.rollback()
+
+def add_num_questions_column():
+    """Add num_questions column to quiz table and fill it from the questions JSON"""
+    with app.app_context():
+        try:
+            print("Adding 'num_questions' column to quiz table...")
+            db.session.execute(text(
+                "ALTER TABLE quiz ADD COLUMN IF NOT EXISTS num_questions INTEGER NOT NULL DEFAULT 0"
             ))
+            db.session.execute(text(
+                "UPDATE quiz SET num_questions = jsonb_array_length(questions::jsonb) "
+                "WHERE num_questions = 0"
+            ))
+            db.session.commit()
+            print("✓ num_questions column ready!")
             
-            if result.fetchone():
-                print("✓ Migration completed successfully!")
-            else:
-                print("✗ Migration failed - column not found after creation")
+        except Exception as e:
+            print(f"✗ num_questions migration failed: {str(e)}")
+            db.session.rollback()
+
+def backfill_question_fields():
+    """Store correct_answer_normalized and correct_index on existing quiz questions"""
+    with app.app_context():
+        try:
+            print("Back-filling precomputed answer fields...")
+            updated = 0
+            
+            for quiz in Quiz.query.options(undefer(Quiz.questions)).all():
+                questions = []
+                changed = False
                 
+                for question in quiz.questions:
+                    question = dict(question)
+                    correct_normalized = normalize_answer(question['correct_answer'])
+                    
+                    if 'correct_answer_normalized' not in question:
+                        question['correct_answer_normalized'] = correct_normalized
+                        changed = True
+                    
+                    if 'correct_index' not in question:
+                        normalized_options = [normalize_answer(opt) for opt in question['options']]
+                        if correct_normalized in normalized_options:
+                            question['correct_index'] = normalized_options.index(correct_normalized)
+                            changed = True
+                    
+                    questions.append(question)
+                
+                if changed:
+                    # Assign a new list so SQLAlchemy detects the JSON change
+                    quiz.questions = questions
+                    updated += 1
+            
+            db.session.commit()
+            print(f"✓ Back-filled {updated} quizzes!")
+            
         except Exception as e:
-            print(f"✗ Migration failed: {str(e)}")
+            print(f"✗ Back-fill failed: {str(e)}")
             db.session.rollback()
 
 if __name__ == "__main__":
     print("=" * 60)
-    print("Database Migration - Adding shuffle_options column")
+    print("Database Migration - Columns, indexes, JSONB and answer back-fill")
     print("=" * 60)
     migrate_database()
+    add_indexes()
+    convert_json_columns()
+    add_num_questions_column()
+    backfill_question_fields()
     print("=" * 60)
\ No newline at end of file